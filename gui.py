@@ -1,13 +1,20 @@
 import os
-from typing import List, Optional, Dict
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, List, Optional, Dict, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from matplotlib.backends.backend_qt5agg import (
     FigureCanvasQTAgg as FigureCanvas,
 )
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
 from PyQt5.QtWidgets import (
+    QAbstractItemView,
     QComboBox,
     QDialog,
     QFileDialog,
@@ -15,105 +22,294 @@ from PyQt5.QtWidgets import (
     QGroupBox,
     QLabel,
     QLineEdit,
-    QListWidget,
     QMainWindow,
     QMessageBox,
     QPushButton,
+    QTreeView,
     QTreeWidget,
     QTreeWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 
-from plotting import create_combined_plot, create_plot
-from scraper import get_app_reviews, search_app
-from utils import save_reviews_to_csv
+from plotting import (
+    PLOT_TYPES,
+    compute_series,
+    create_combined_plot,
+    create_plot,
+)
+from scraper import (
+    cached_search_app,
+    iter_review_pages,
+    load_search_cache,
+    save_search_cache,
+)
+from utils import (
+    CSV_BUFFER_SIZE,
+    build_reviews_dataframe,
+    find_cached_reviews,
+    load_cached_reviews,
+    remove_cached_reviews,
+    review_cache_path,
+    save_cached_reviews,
+    save_reviews_to_csv,
+)
 
+MAX_FETCH_WORKERS = 8
+MAX_SEARCH_WORKERS = 4
+# Seconds between the start of consecutive app fetches, so concurrent
+# workers don't all hit Google Play at the same instant.
+FETCH_STAGGER = 0.1
 
-class FetchThread(QThread):
+
+class FetchSignals(QObject):
     status_update = pyqtSignal(str)
+    # app_id, reviews DataFrame, precomputed series by plot type
+    app_fetched = pyqtSignal(str, object, object)
+    no_reviews = pyqtSignal(str)
     finished = pyqtSignal()
 
+
+class FetchRunnable(QRunnable):
+
     def __init__(
         self,
         app_ids: List[str],
         app_names: Dict[str, str],
         max_reviews: Optional[int],
         output_dir: str,
-        all_app_data: Dict[str, pd.DataFrame],
     ) -> None:
         super().__init__()
-        self.app_ids = app_ids
-        self.app_names = app_names
+        self.signals = FetchSignals()
+        # Snapshots, so apps removed in the GUI during the fetch can't
+        # disappear from under the worker.
+        self.app_ids = list(app_ids)
+        self.app_names = dict(app_names)
         self.max_reviews = max_reviews
         self.output_dir = output_dir
-        self.all_app_data = all_app_data
 
     def run(self) -> None:
-        if not self.app_ids:
-            QMessageBox.warning(
-                None, "Warning", "Please add at least one App ID."
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # Disk writes go through a single writer thread so fetches never
+        # wait on CSV I/O.
+        self._write_queue = queue.Queue()
+        writer = threading.Thread(target=self._write_csv_pages, daemon=True)
+        writer.start()
+
+        # Each app is an independent, network-bound fetch, so run them
+        # concurrently and handle results in completion order.
+        max_workers = min(len(self.app_ids), MAX_FETCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {}
+            incomplete = []
+            for index, app_id in enumerate(self.app_ids):
+                self.signals.status_update.emit(
+                    f"Fetching reviews for {self.app_names[app_id]}..."
+                )
+                # Only the first wave starts together; later apps already
+                # wait for a free worker.
+                start_delay = (
+                    index * FETCH_STAGGER if index < max_workers else 0
+                )
+                future = pool.submit(self._fetch_app, app_id, start_delay)
+                futures[future] = app_id
+
+            for future in as_completed(futures):
+                app_id = futures[future]
+                app_name = self.app_names[app_id]
+                reviews_df, complete = future.result()
+                if reviews_df is not None:
+                    # Every plot type is computed here, off the GUI thread,
+                    # so switching plot types later only redraws.
+                    series = {
+                        plot_type: compute_series(reviews_df, plot_type)
+                        for plot_type in PLOT_TYPES
+                    }
+                    # Stored by the GUI thread, which also reads the data.
+                    self.signals.app_fetched.emit(app_id, reviews_df, series)
+                    status = (
+                        f"Fetched {len(reviews_df)} reviews for {app_name}"
+                    )
+                    if not complete:
+                        status += " (incomplete: fetching stopped on an error)"
+                        incomplete.append(app_name)
+                    self.signals.status_update.emit(status + ".")
+                else:
+                    # Widgets may only be used from the GUI thread, so the
+                    # message box is shown by the connected slot there.
+                    self.signals.no_reviews.emit(app_id)
+
+        self._write_queue.put(None)
+        writer.join()
+        if incomplete:
+            self.signals.status_update.emit(
+                "Reviews fetched and saved, but incomplete for "
+                f"{', '.join(incomplete)}."
             )
-            self.finished.emit()
-            return
+        else:
+            self.signals.status_update.emit("Reviews fetched and saved.")
+        self.signals.finished.emit()
 
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+    def _fetch_app(
+        self, app_id: str, start_delay: float = 0
+    ) -> Tuple[Optional[pd.DataFrame], bool]:
+        """
+        Fetches an app's reviews, queueing each page for the CSV writer.
+        Reuses the cached reviews instead if a fresh cache exists for the
+        same max_reviews (and so matches the CSV). Only complete fetches
+        are cached.
 
-        for app_id in self.app_ids:
-            app_name = self.app_names[app_id]
-            self.status_update.emit(f"Fetching reviews for {app_name}...")
-            reviews_list = get_app_reviews(
-                app_id, max_reviews=self.max_reviews
-            )
-            if reviews_list:
-                reviews_df = pd.DataFrame(reviews_list)
-                reviews_df["review_date"] = pd.to_datetime(
-                    reviews_df["review_date"]
-                )
-                reviews_df["app_name"] = app_name
-                self.all_app_data[app_id] = reviews_df
-                filename = os.path.join(
-                    self.output_dir, f"{app_id}_reviews.csv"
-                )
-                save_reviews_to_csv(reviews_df, filename)
-            else:
-                QMessageBox.information(
-                    None, "Info", f"No reviews retrieved for {app_id}."
+        Args:
+            app_id (str): The ID of the app.
+            start_delay (float): Seconds to wait before contacting Google
+                Play (default: 0). Cache hits skip the wait.
+
+        Returns:
+            tuple: The columns needed for plotting (None if no reviews were
+                retrieved), and whether every requested review was.
+        """
+        app_name = self.app_names[app_id]
+        filename = os.path.join(self.output_dir, f"{app_id}_reviews.csv")
+        cache_file = review_cache_path(
+            self.output_dir, app_id, self.max_reviews
+        )
+        if os.path.exists(filename):
+            cached_df = load_cached_reviews(cache_file)
+            if cached_df is not None:
+                return cached_df, True
+
+        # The CSV is about to be rewritten, so caches from fetches with
+        # other limits would no longer match it. Only this fetch's cache
+        # may be reused next time.
+        remove_cached_reviews(self.output_dir, app_id)
+        time.sleep(start_delay)
+        frames = []
+        complete = False
+        pages = iter_review_pages(app_id, max_reviews=self.max_reviews)
+        try:
+            while True:
+                try:
+                    page = next(pages)
+                except StopIteration:
+                    complete = True
+                    break
+                except Exception:
+                    break  # Already reported by iter_review_pages
+                page_df = build_reviews_dataframe(page, app_id, app_name)
+                self._write_queue.put((filename, page_df))
+                # The review text lives on disk; only keep what plots need.
+                frames.append(page_df.drop(columns="review_text"))
+        except Exception as e:
+            print(f"Error processing reviews for {app_id}: {e}")
+        finally:
+            pages.close()
+            if frames:
+                self._write_queue.put((filename, None))
+
+        if not frames:
+            return None, complete
+        # Sort once here so plotting never has to. Pages arrive in relevance
+        # order, not by date; mergesort is stable, so reviews with equal
+        # timestamps keep their relevance order.
+        reviews_df = pd.concat(frames, copy=False).sort_values(
+            "review_date", kind="mergesort", ignore_index=True
+        )
+        # A partial fetch must not pass for a fresh, complete one.
+        if complete:
+            save_cached_reviews(reviews_df, cache_file)
+        return reviews_df, complete
+
+    def _write_csv_pages(self) -> None:
+        """
+        Writes queued review pages to their CSV files until a None item
+        arrives. A (filename, None) item closes that file.
+        """
+        csv_files = {}
+        try:
+            while True:
+                item = self._write_queue.get()
+                if item is None:
+                    break
+                filename, page_df = item
+                if page_df is None:
+                    csv_files.pop(filename).close()
+                    print(f"Reviews saved to {filename}")
+                    continue
+                header = filename not in csv_files
+                if header:
+                    csv_files[filename] = open(
+                        filename,
+                        "w",
+                        buffering=CSV_BUFFER_SIZE,
+                        newline="",
+                        encoding="utf-8",
+                    )
+                save_reviews_to_csv(
+                    page_df, csv_files[filename], header=header
                 )
-        self.status_update.emit("Reviews fetched and saved.")
-        self.finished.emit()
+        finally:
+            for csv_file in csv_files.values():
+                csv_file.close()
 
 
 class AppSelectionDialog(QDialog):
     def __init__(
-        self, app_titles: List[str], app_ids: List[str], parent=None
+        self, search_results: Dict[str, List[Dict[str, Any]]], parent=None
     ) -> None:
         super().__init__(parent)
-        self.setWindowTitle("Choose App")
-        self.app_ids = app_ids
-        self.selected_app_id = None
+        self.setWindowTitle("Choose Apps")
+        self.selected_apps = []
 
         layout = QVBoxLayout()
-        self.list_widget = QListWidget()
-        self.list_widget.addItems(app_titles)
-        layout.addWidget(self.list_widget)
+        self.app_tree = QTreeWidget()
+        self.app_tree.setHeaderLabels(["App", "App Id"])
+        self.app_tree.setColumnWidth(0, 250)
+        # One group per searched name, with a checkbox per matching app.
+        for app_name, results in search_results.items():
+            name_item = QTreeWidgetItem(self.app_tree, [app_name])
+            name_item.setFlags(Qt.ItemIsEnabled)
+            for result in results:
+                app_item = QTreeWidgetItem(
+                    name_item, [result["title"], result["appId"]]
+                )
+                app_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
+                app_item.setCheckState(0, Qt.Unchecked)
+        self.app_tree.expandAll()
+        self.app_tree.itemChanged.connect(self.on_item_changed)
+        layout.addWidget(self.app_tree)
 
         ok_button = QPushButton("OK")
         ok_button.clicked.connect(self.on_select)
         layout.addWidget(ok_button)
 
         self.setLayout(layout)
+        self.resize(500, 400)
+
+    def on_item_changed(self, item: QTreeWidgetItem, column: int) -> None:
+        # Each searched name stands for one app, so checking a candidate
+        # unchecks the others under the same name.
+        name_item = item.parent()
+        if name_item is None or item.checkState(0) != Qt.Checked:
+            return
+        for child in range(name_item.childCount()):
+            sibling = name_item.child(child)
+            if sibling is not item:
+                sibling.setCheckState(0, Qt.Unchecked)
 
     def on_select(self) -> None:
-        try:
-            index = self.list_widget.currentRow()
-            if index >= 0:
-                self.selected_app_id = self.app_ids[index]
-                self.accept()
-            else:
-                QMessageBox.warning(self, "Warning", "Please select an app.")
-        except IndexError:
+        self.selected_apps = []
+        for index in range(self.app_tree.topLevelItemCount()):
+            name_item = self.app_tree.topLevelItem(index)
+            for child in range(name_item.childCount()):
+                app_item = name_item.child(child)
+                if app_item.checkState(0) == Qt.Checked:
+                    self.selected_apps.append(
+                        (app_item.text(1), name_item.text(0))
+                    )
+        if self.selected_apps:
+            self.accept()
+        else:
             QMessageBox.warning(self, "Warning", "Please select an app.")
 
 
@@ -125,8 +321,11 @@ class AppReviewGUI(QMainWindow):
 
         self.app_ids = []
         self.all_app_data = {}  # Store DataFrames here
+        # Precomputed plot series by app_id, then plot type
+        self.app_series = {}
         self.output_dir = "app_reviews"
         self.app_names = {}  # Dictionary to map app_id to app_name
+        load_search_cache()
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -142,8 +341,13 @@ class AppReviewGUI(QMainWindow):
         app_name_layout.addWidget(self.app_name_label, 0, 0)
         app_name_layout.addWidget(self.app_name_entry, 0, 1)
         app_name_layout.addWidget(self.add_app_name_button, 0, 2)
-        self.app_id_tree = QTreeWidget()
-        self.app_id_tree.setHeaderLabels(["App Id", "App Name"])
+        self.app_id_model = QStandardItemModel(0, 2)
+        self.app_id_model.setHorizontalHeaderLabels(["App Id", "App Name"])
+        self.app_id_tree = QTreeView()
+        self.app_id_tree.setModel(self.app_id_model)
+        self.app_id_tree.setRootIsDecorated(False)
+        self.app_id_tree.setUniformRowHeights(True)
+        self.app_id_tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.app_id_tree.setColumnWidth(0, 200)
         app_name_layout.addWidget(self.app_id_tree, 1, 0, 1, 3)
         self.remove_app_id_button = QPushButton("Remove Selected")
@@ -216,73 +420,134 @@ class AppReviewGUI(QMainWindow):
         # Plot Frame
         self.fig, self.ax = plt.subplots(figsize=(8, 5), dpi=100)
         self.canvas = FigureCanvas(self.fig)
+        self._lines = {}  # Line2D artists reused across redraws, by app
+        # What the canvas currently shows, so repeat clicks can be skipped;
+        # _data_version changes whenever fetched data arrives.
+        self._shown_plot = None
+        self._data_version = 0
         main_layout.addWidget(self.canvas)
         main_layout.setStretch(5, 1)  # Allow plot to expand
 
-    def choose_app_id(
-        self, app_titles: List[str], app_ids: List[str]
-    ) -> Optional[str]:
+        self._load_cached()
+
+    def _load_cached(self) -> None:
         """
-        Creates a dialog for the user to choose the correct app ID.
+        Reloads the reviews cached by earlier sessions in the output
+        directory, so they can be plotted without fetching them again.
+        """
+        for app_id, cache_file in find_cached_reviews(self.output_dir).items():
+            if app_id in self.app_ids:
+                continue
+            # Old reviews are still worth showing; fetching refreshes them.
+            reviews_df = load_cached_reviews(cache_file, max_age=float("inf"))
+            if reviews_df is None or reviews_df.empty:
+                continue
+            self.all_app_data[app_id] = reviews_df
+            self._add_app(app_id, str(reviews_df["app_name"].iloc[0]))
+        self.update_single_app_combobox()
+
+    def _add_app(self, app_id: str, app_name: str) -> None:
+        self.app_ids.append(app_id)
+        self.app_names[app_id] = app_name
+        self.app_id_model.appendRow(
+            [QStandardItem(app_id), QStandardItem(app_name)]
+        )
+
+    def choose_app_ids(
+        self, search_results: Dict[str, List[Dict[str, Any]]]
+    ) -> List[Tuple[str, str]]:
+        """
+        Creates a dialog for the user to choose the correct app IDs for
+        every searched name at once.
 
         Args:
-            app_titles (list): List of app titles.
-            app_ids (list): List of corresponding app IDs.
+            search_results (dict): The search results (dicts with title and
+                appId) for each app name.
 
         Returns:
-            str: The selected app ID or None if no selection is made.
+            list: The selected (app ID, app name) pairs, or an empty list
+                if the dialog was cancelled.
         """
-        dialog = AppSelectionDialog(app_titles, app_ids, self)
+        dialog = AppSelectionDialog(search_results, self)
         if dialog.exec_():
-            return dialog.selected_app_id
-        return None
+            return dialog.selected_apps
+        return []
 
     def add_app_name(self) -> None:
         app_names_input = self.app_name_entry.text()
-        new_app_names = [
-            name.strip() for name in app_names_input.split(",") if name.strip()
-        ]
+        new_app_names = list(
+            dict.fromkeys(
+                name.strip()
+                for name in app_names_input.split(",")
+                if name.strip()
+            )
+        )
+        if not new_app_names:
+            return
+
+        # Searches are independent network calls, so run them together.
+        with ThreadPoolExecutor(
+            max_workers=min(len(new_app_names), MAX_SEARCH_WORKERS)
+        ) as pool:
+            all_results = list(pool.map(cached_search_app, new_app_names))
 
-        for app_name in new_app_names:
-            results = search_app(app_name)
+        search_results = {}
+        not_found = []
+        for app_name, results in zip(new_app_names, all_results):
             if results:
-                app_titles = [result["title"] for result in results]
-                app_ids = [result["appId"] for result in results]
-                selected_app_id = self.choose_app_id(app_titles, app_ids)
-                if selected_app_id and selected_app_id not in self.app_ids:
-                    self.app_ids.append(selected_app_id)
-                    self.app_names[selected_app_id] = app_name
-                    item = QTreeWidgetItem(
-                        self.app_id_tree, [selected_app_id, app_name]
-                    )
+                search_results[app_name] = results
             else:
-                QMessageBox.information(
-                    self, "App Not Found", f"No apps found for '{app_name}'."
-                )
+                not_found.append(f"'{app_name}'")
+        if not_found:
+            QMessageBox.information(
+                self,
+                "App Not Found",
+                f"No apps found for {', '.join(not_found)}.",
+            )
+
+        if search_results:
+            for app_id, app_name in self.choose_app_ids(search_results):
+                if app_id not in self.app_ids:
+                    self._add_app(app_id, app_name)
         self.app_name_entry.clear()
         self.update_single_app_combobox()
 
     def remove_app_id(self) -> None:
-        selected_items = self.app_id_tree.selectedItems()
-        if not selected_items:
+        selected_rows = self.app_id_tree.selectionModel().selectedRows()
+        if not selected_rows:
             QMessageBox.warning(self, "Warning", "No App ID selected.")
             return
-        item = selected_items[0]
-        app_id_to_remove = item.text(0)
+        row = selected_rows[0].row()
+        app_id_to_remove = self.app_id_model.item(row, 0).text()
         self.app_ids.remove(app_id_to_remove)
         del self.app_names[app_id_to_remove]
-        self.app_id_tree.takeTopLevelItem(
-            self.app_id_tree.indexOfTopLevelItem(item)
-        )
+        self.app_id_model.removeRow(row)
         self.update_single_app_combobox()
 
     def update_single_app_combobox(self) -> None:
-        self.single_app_combo.clear()
-        self.single_app_combo.addItems(
-            [self.app_names[app_id] for app_id in self.app_ids]
-        )
+        combo = self.single_app_combo
+        current_app_id = combo.currentData()
+        # Rebuild without emitting a signal per item, then restore the
+        # previous selection if that app is still listed. Each item carries
+        # its app ID, so selections never need a lookup by display name.
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            for app_id in self.app_ids:
+                combo.addItem(self.app_names[app_id], app_id)
+            index = combo.findData(current_app_id)
+            if index >= 0:
+                combo.setCurrentIndex(index)
+        finally:
+            combo.blockSignals(False)
 
     def fetch_reviews(self) -> None:
+        if not self.app_ids:
+            QMessageBox.warning(
+                self, "Warning", "Please add at least one App ID."
+            )
+            return
+
         self.fetch_button.setEnabled(False)
         try:
             max_reviews_input = self.max_reviews_entry.text()
@@ -292,18 +557,59 @@ class AppReviewGUI(QMainWindow):
             self.fetch_button.setEnabled(True)
             return
 
-        self.thread = FetchThread(
+        fetch = FetchRunnable(
             self.app_ids,
             self.app_names,
             max_reviews,
             self.output_dir,
-            self.all_app_data,
         )
-        self.thread.status_update.connect(self.status_label.setText)
-        self.thread.finished.connect(
-            lambda: self.fetch_button.setEnabled(True)
+        fetch.signals.status_update.connect(self.status_label.setText)
+        fetch.signals.app_fetched.connect(self.on_app_fetched)
+        fetch.signals.no_reviews.connect(self.on_no_reviews)
+        fetch.signals.finished.connect(self.on_fetch_finished)
+        QThreadPool.globalInstance().start(fetch)
+
+    def on_app_fetched(
+        self,
+        app_id: str,
+        reviews_df: pd.DataFrame,
+        series: Dict[str, Tuple[np.ndarray, np.ndarray]],
+    ) -> None:
+        if app_id not in self.app_ids:
+            return  # Removed while it was being fetched
+        self.all_app_data[app_id] = reviews_df
+        self.app_series[app_id] = series
+        self._data_version += 1
+
+    def on_no_reviews(self, app_id: str) -> None:
+        QMessageBox.information(
+            self, "Info", f"No reviews retrieved for {app_id}."
         )
-        self.thread.start()
+
+    def on_fetch_finished(self) -> None:
+        self._data_version += 1
+        self.fetch_button.setEnabled(True)
+
+    def _get_series(
+        self, app_id: str, plot_type: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns an app's plot series, computing and memoizing it if the
+        fetch did not already precompute it.
+
+        Args:
+            app_id (str): The ID of the app.
+            plot_type (str): The type of plot.
+
+        Returns:
+            tuple: The x (date) and y (average rating) arrays.
+        """
+        app_series = self.app_series.setdefault(app_id, {})
+        if plot_type not in app_series:
+            app_series[plot_type] = compute_series(
+                self.all_app_data[app_id], plot_type
+            )
+        return app_series[plot_type]
 
     def visualize_single(self) -> None:
         selected_app_name = self.single_app_combo.currentText()
@@ -311,27 +617,26 @@ class AppReviewGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "Select an app.")
             return
 
-        selected_app_id = next(
-            (
-                app_id
-                for app_id, name in self.app_names.items()
-                if name == selected_app_name
-            ),
-            None,
-        )
-        if not selected_app_id or selected_app_id not in self.all_app_data:
+        selected_app_id = self.single_app_combo.currentData()
+        if selected_app_id not in self.all_app_data:
             QMessageBox.critical(
                 self, "Error", f"No data for {selected_app_name}."
             )
             return
         plot_type = self.plot_type_combo.currentText()
+        plot_key = ("single", plot_type, selected_app_id, self._data_version)
+        if plot_key == self._shown_plot:
+            return
         create_plot(
             self.ax,
             self.all_app_data[selected_app_id],
             plot_type,
             selected_app_name,
+            lines=self._lines,
+            series=self._get_series(selected_app_id, plot_type),
         )
-        self.canvas.draw()
+        self._shown_plot = plot_key
+        self.canvas.draw_idle()
 
     def visualize_combined(self) -> None:
         if len(self.all_app_data) < 2:
@@ -340,8 +645,26 @@ class AppReviewGUI(QMainWindow):
             )
             return
         plot_type = self.visualize_combined_plot_type_combo.currentText()
-        create_combined_plot(self.ax, self.all_app_data, plot_type)
-        self.canvas.draw()
+        plot_key = (
+            "combined",
+            plot_type,
+            tuple(sorted(self.all_app_data)),
+            self._data_version,
+        )
+        if plot_key == self._shown_plot:
+            return
+        create_combined_plot(
+            self.ax,
+            self.all_app_data,
+            plot_type,
+            lines=self._lines,
+            series={
+                app_id: self._get_series(app_id, plot_type)
+                for app_id in self.all_app_data
+            },
+        )
+        self._shown_plot = plot_key
+        self.canvas.draw_idle()
 
     def set_output_directory(self) -> None:
         directory = QFileDialog.getExistingDirectory(
@@ -350,3 +673,7 @@ class AppReviewGUI(QMainWindow):
         if directory:
             self.output_dir = directory
             self.output_dir_display.setText(self.output_dir)
+
+    def closeEvent(self, event) -> None:
+        save_search_cache()
+        super().closeEvent(event)
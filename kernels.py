@@ -0,0 +1,80 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def cumulative_mean(values: np.ndarray) -> np.ndarray:
+    """
+    Computes the running mean of all values so far (like pandas'
+    expanding().mean()) from a single cumulative sum.
+
+    Args:
+        values (np.ndarray): The values to average, in order.
+
+    Returns:
+        np.ndarray: The float64 mean of values[:i + 1] at each position i.
+    """
+    return np.cumsum(values, dtype=np.float64) / np.arange(1, len(values) + 1)
+
+
+def move_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Computes a trailing moving mean, averaging fewer values at the start
+    (like pandas' rolling(window, min_periods=1).mean()).
+
+    Uses running sums, adding the newest value and dropping the one that
+    left the window, instead of pandas' generic windowing machinery.
+
+    Args:
+        values (np.ndarray): The values to average, in order.
+        window (int): The number of values in each window.
+
+    Returns:
+        np.ndarray: The float64 mean of the last window values (or all
+            values so far, if fewer) at each position.
+    """
+    sums = np.cumsum(values, dtype=np.float64)
+    sums[window:] -= sums[:-window].copy()
+    counts = np.minimum(np.arange(1, len(values) + 1, dtype=np.int64), window)
+    return sums / counts
+
+
+def monthly_mean(
+    dates: np.ndarray, values: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the mean value per calendar month (like pandas'
+    resample("M").mean()) by binning integer month keys with bincount.
+
+    Args:
+        dates (np.ndarray): The datetime64 date of each value. NaT dates
+            are ignored.
+        values (np.ndarray): The values to average.
+
+    Returns:
+        tuple: The month-end dates of every month from the first to the
+            last one, and the mean value for each (NaN for empty months,
+            which leaves a gap in the plotted line).
+    """
+    months = dates.astype("datetime64[M]")
+    valid = ~np.isnat(months)
+    if not valid.all():
+        months = months[valid]
+        values = values[valid]
+    if len(months) == 0:
+        return np.array([], dtype="datetime64[ns]"), np.array([])
+
+    first = months.min()
+    keys = (months - first).astype(np.int64)
+    n_months = int(keys.max()) + 1
+    sums = np.bincount(
+        keys, weights=values.astype(np.float64), minlength=n_months
+    )
+    counts = np.bincount(keys, minlength=n_months)
+    with np.errstate(invalid="ignore"):
+        means = sums / counts
+    month_starts = first + np.arange(n_months + 1)
+    month_ends = month_starts[1:].astype("datetime64[D]") - np.timedelta64(
+        1, "D"
+    )
+    return month_ends.astype("datetime64[ns]"), means
@@ -1,8 +1,161 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Tuple
 import matplotlib.axes
+from matplotlib.lines import Line2D
+
+from kernels import cumulative_mean, monthly_mean, move_mean
+
+ROLLING_WINDOW = 30
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def _cumulative_series(
+    dates: np.ndarray, ratings: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    return dates, cumulative_mean(ratings)
+
+
+def _rolling_series(
+    dates: np.ndarray, ratings: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    return dates, move_mean(ratings, ROLLING_WINDOW)
+
+
+# Series function, single-app title and y label for each plot type.
+PLOT_KERNELS = {
+    "cumulative": (
+        _cumulative_series,
+        "Cumulative Average Rating Over Time",
+        "Cumulative Average Rating",
+    ),
+    "rolling": (
+        _rolling_series,
+        "30-Day Rolling Average Rating Over Time",
+        "Rolling Average Rating",
+    ),
+    "monthly": (monthly_mean, "Average Monthly Rating", "Average Rating"),
+}
+PLOT_TYPES = tuple(PLOT_KERNELS)
+
+
+def compute_series(
+    reviews_df: pd.DataFrame, plot_type: str = "cumulative"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the dates and average ratings plotted for one app from the
+    date and rating arrays, without modifying or copying the DataFrame.
+
+    Args:
+        reviews_df (pd.DataFrame): The DataFrame containing reviews.
+        plot_type (str): The type of plot ("cumulative", "rolling", "monthly").
+            Unknown types fall back to "cumulative".
+
+    Returns:
+        tuple: The x (date) and y (average rating) arrays.
+    """
+    dates = reviews_df["review_date"].to_numpy()
+    ratings = reviews_df["review_rating"].to_numpy()
+    if not reviews_df["review_date"].is_monotonic_increasing:
+        # Sort just the two arrays rather than copying the whole frame.
+        order = np.argsort(dates, kind="stable")
+        dates = dates[order]
+        ratings = ratings[order]
+    series_func = PLOT_KERNELS.get(plot_type, PLOT_KERNELS["cumulative"])[0]
+    return series_func(dates, ratings)
+
+
+def _reset_axes(
+    ax: matplotlib.axes.Axes,
+    lines: Optional[Dict[str, Line2D]],
+    keep: Iterable[str] = (),
+) -> None:
+    """
+    Prepares the axes for a new plot.
+
+    Without a line cache the axes are cleared. With one, only the cached
+    lines not listed in keep are removed, so the rest can be updated in
+    place instead of re-creating every artist.
+    """
+    if lines is None:
+        ax.clear()
+        return
+
+    keep = set(keep)
+    for key in list(lines):
+        if key not in keep or lines[key].axes is not ax:
+            if lines[key].axes is ax:
+                lines[key].remove()
+            del lines[key]
+    for artist in ax.lines[:]:
+        if artist not in lines.values():
+            artist.remove()
+    for text in ax.texts[:]:
+        text.remove()
+    legend = ax.get_legend()
+    if legend is not None:
+        legend.remove()
+
+
+def _plot_line(
+    ax: matplotlib.axes.Axes,
+    lines: Optional[Dict[str, Line2D]],
+    key: str,
+    x,
+    y,
+    label: Optional[str] = None,
+) -> None:
+    """Plots a line, reusing the cached Line2D for key when there is one."""
+    line = lines.get(key) if lines is not None else None
+    if line is None:
+        (line,) = ax.plot(x, y, label=label)
+        if lines is not None:
+            lines[key] = line
+    else:
+        line.set_data(x, y)
+        line.set_label(label)
+
+
+def _show_no_data(ax: matplotlib.axes.Axes) -> None:
+    ax.text(
+        0.5,
+        0.5,
+        "No Data Available",
+        ha="center",
+        va="center",
+        transform=ax.transAxes,
+        fontsize=12,
+        color="gray",
+    )
+
+
+def _finish_axes(
+    ax: matplotlib.axes.Axes, title: str, ylabel: str, legend: bool = False
+) -> None:
+    """Rescales the axes to the plotted lines and applies the shared styling."""
+    ax.relim()
+    ax.autoscale_view()
+    ax.set_title(title)
+    ax.set_xlabel("Date")
+    ax.set_ylabel(ylabel)
+    ax.grid(True)
+    # Tick formatters and locators belong to one axis, so they can't be
+    # shared module-wide; instead, keep the ones already set on this axis
+    # from an earlier call.
+    formatter = ax.xaxis.get_major_formatter()
+    if not (
+        isinstance(formatter, mdates.DateFormatter)
+        and formatter.fmt == DATE_FORMAT
+    ):
+        ax.xaxis.set_major_formatter(mdates.DateFormatter(DATE_FORMAT))
+    if not isinstance(ax.xaxis.get_major_locator(), mdates.AutoDateLocator):
+        ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+    if legend:
+        ax.legend()
+    ax.figure.tight_layout()
 
 
 def create_plot(
@@ -10,6 +163,8 @@ def create_plot(
     reviews_df: pd.DataFrame,
     plot_type: str = "cumulative",
     app_id: Optional[str] = None,
+    lines: Optional[Dict[str, Line2D]] = None,
+    series: Optional[Tuple[np.ndarray, np.ndarray]] = None,
 ) -> None:
     """
     Creates a plot for a single app's reviews.
@@ -19,75 +174,42 @@ def create_plot(
         reviews_df (pd.DataFrame): The DataFrame containing reviews.
         plot_type (str): The type of plot ("cumulative", "rolling", "monthly").
         app_id (str): The app ID (optional for title).
+        lines (dict): Cache of Line2D artists by app ID, reused across calls
+            (optional; the axes are cleared when omitted).
+        series (tuple): The precomputed compute_series result for this
+            plot_type (optional; computed from reviews_df when omitted).
     """
+    # Lines are cached by the real app ID (app_id here is only the title),
+    # so apps sharing a display name never share a line.
+    if "app_id" in reviews_df and not reviews_df.empty:
+        key = str(reviews_df["app_id"].iloc[0])
+    else:
+        key = app_id or ""
     if reviews_df.empty:
-        ax.clear()
-        ax.text(
-            0.5,
-            0.5,
-            "No Data Available",
-            ha="center",
-            va="center",
-            transform=ax.transAxes,
-            fontsize=12,
-            color="gray",
-        )
+        _reset_axes(ax, lines)
+        _show_no_data(ax)
         return
 
-    df = reviews_df.sort_values("review_date")
-    ax.clear()
-
-    if plot_type == "cumulative":
-        df["cumulative_average_rating"] = (
-            df["review_rating"].expanding().mean()
-        )
-        ax.plot(df["review_date"], df["cumulative_average_rating"])
-        title = "Cumulative Average Rating Over Time"
-        ylabel = "Cumulative Average Rating"
-
-    elif plot_type == "rolling":
-        df["rolling_average_rating"] = (
-            df["review_rating"].rolling(window=30, min_periods=1).mean()
-        )
-        ax.plot(df["review_date"], df["rolling_average_rating"])
-        title = "30-Day Rolling Average Rating Over Time"
-        ylabel = "Rolling Average Rating"
-
-    elif plot_type == "monthly":
-        df_monthly = (
-            df.resample("M", on="review_date")["review_rating"]
-            .mean()
-            .reset_index()
-        )
-        ax.plot(df_monthly["review_date"], df_monthly["review_rating"])
-        title = "Average Monthly Rating"
-        ylabel = "Average Rating"
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m"))
-        ax.xaxis.set_major_locator(mdates.MonthLocator())
+    if series is None:
+        series = compute_series(reviews_df, plot_type)
+    _reset_axes(ax, lines, keep=[key])
+    _plot_line(ax, lines, key, *series)
 
+    if plot_type in PLOT_KERNELS:
+        _, title, ylabel = PLOT_KERNELS[plot_type]
     else:
-        df["cumulative_average_rating"] = (
-            df["review_rating"].expanding().mean()
-        )
-        ax.plot(df["review_date"], df["cumulative_average_rating"])
-        title = "Cumulative Average Rating Over Time (Invalid plot_type)"
-        ylabel = "Cumulative Average Rating"
-
-    ax.set_xlabel("Date")
-    ax.set_ylabel(ylabel)
-    ax.grid(True)
-    ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
-    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+        _, title, ylabel = PLOT_KERNELS["cumulative"]
+        title += " (Invalid plot_type)"
     title_str = title if not app_id else f"{title} for {app_id}"
-    ax.set_title(title_str)
-    plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
-    ax.figure.tight_layout()
+    _finish_axes(ax, title_str, ylabel)
 
 
 def create_combined_plot(
     ax: matplotlib.axes.Axes,
     all_reviews_data: Dict[str, pd.DataFrame],
     plot_type: str = "cumulative",
+    lines: Optional[Dict[str, Line2D]] = None,
+    series: Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]] = None,
 ) -> None:
     """
     Creates a combined plot for multiple apps' reviews.
@@ -96,78 +218,38 @@ def create_combined_plot(
         ax (matplotlib.axes.Axes): The axes to plot on.
         all_reviews_data (dict): A dictionary of DataFrames containing reviews for each app.
         plot_type (str): The type of plot ("cumulative", "rolling", "monthly").
+        lines (dict): Cache of Line2D artists by app ID, reused across calls
+            (optional; the axes are cleared when omitted).
+        series (dict): Precomputed compute_series results for this
+            plot_type by app ID (optional; apps missing from it are
+            computed from their DataFrame).
     """
-    ax.clear()
+    app_names = {
+        app_id: reviews_df.get("app_name", [app_id])[0]
+        for app_id, reviews_df in all_reviews_data.items()
+        if not reviews_df.empty
+    }
+    _reset_axes(ax, lines, keep=app_names)
     if not all_reviews_data:
-        ax.text(
-            0.5,
-            0.5,
-            "No Data Available",
-            ha="center",
-            va="center",
-            transform=ax.transAxes,
-            fontsize=12,
-            color="gray",
-        )
+        _show_no_data(ax)
         return
 
+    series = series or {}
     for app_id, reviews_df in all_reviews_data.items():
         if reviews_df.empty:
             print(f"Skipping {app_id} (no data).")
             continue
 
-        df = reviews_df.sort_values("review_date")
-        app_name = reviews_df.get("app_name", [app_id])[0]
-
-        if plot_type == "cumulative":
-            df["cumulative_average_rating"] = (
-                df["review_rating"].expanding().mean()
-            )
-            ax.plot(
-                df["review_date"],
-                df["cumulative_average_rating"],
-                label=app_name,
-            )
-            ylabel = "Cumulative Average Rating"
-        elif plot_type == "rolling":
-            df["rolling_average_rating"] = (
-                df["review_rating"].rolling(window=30, min_periods=1).mean()
-            )
-            ax.plot(
-                df["review_date"], df["rolling_average_rating"], label=app_name
-            )
-            ylabel = "Rolling Average Rating"
-        elif plot_type == "monthly":
-            df_monthly = (
-                df.resample("M", on="review_date")["review_rating"]
-                .mean()
-                .reset_index()
-            )
-            ax.plot(
-                df_monthly["review_date"],
-                df_monthly["review_rating"],
-                label=app_name,
-            )
-            ylabel = "Average Rating"
-            ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m"))
-            ax.xaxis.set_major_locator(mdates.MonthLocator())
-        else:
-            df["cumulative_average_rating"] = (
-                df["review_rating"].expanding().mean()
-            )
-            ax.plot(
-                df["review_date"],
-                df["cumulative_average_rating"],
-                label=app_name,
-            )
-            ylabel = "Cumulative Average Rating"
-
-    ax.set_title(f"Comparison of App Ratings ({plot_type.capitalize()})")
-    ax.set_xlabel("Date")
-    ax.set_ylabel(ylabel)
-    ax.grid(True)
-    ax.xaxis.set_major_formatter(mdates.DateFormatter("%Y-%m-%d"))
-    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-    plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
-    ax.legend()
-    ax.figure.tight_layout()
+        app_series = series.get(app_id)
+        if app_series is None:
+            app_series = compute_series(reviews_df, plot_type)
+        app_name = app_names[app_id]
+        _plot_line(ax, lines, app_id, *app_series, label=app_name)
+
+    ylabel = PLOT_KERNELS.get(plot_type, PLOT_KERNELS["cumulative"])[2]
+    _finish_axes(
+        ax,
+        f"Comparison of App Ratings ({plot_type.capitalize()})",
+        ylabel,
+        legend=True,
+    )
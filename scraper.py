@@ -1,6 +1,54 @@
 from google_play_scraper import reviews, Sort, search
+from google_play_scraper.exceptions import ExtraHTTPError, NotFoundError
+from google_play_scraper.utils import request as play_request
+import json
+import os
+import threading
 import time
-from typing import List, Optional, Dict, Any, Union
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Dict, Any, Tuple, Union
+
+import certifi
+import urllib3
+
+# Connections kept open to Google Play, enough for every concurrent fetch.
+HTTP_POOL_SIZE = 8
+
+_http = urllib3.PoolManager(
+    maxsize=HTTP_POOL_SIZE, cert_reqs="CERT_REQUIRED", ca_certs=certifi.where()
+)
+
+
+def _keep_alive_urlopen(request: Union[str, urllib.request.Request]) -> str:
+    """
+    Drop-in replacement for google_play_scraper's urlopen helper that
+    reuses pooled connections. The library opens a new connection (and
+    TLS handshake) for every request, which adds a round trip or more to
+    each review page.
+    """
+    if isinstance(request, str):
+        request = urllib.request.Request(request)
+    headers = {"User-Agent": f"Python-urllib/{urllib.request.__version__}"}
+    headers.update(request.header_items())
+    response = _http.request(
+        request.get_method(),
+        request.full_url,
+        body=request.data,
+        headers=headers,
+    )
+    if response.status == 404:
+        raise NotFoundError("App not found(404).")
+    if response.status >= 400:
+        raise ExtraHTTPError(
+            f"App not found. Status code {response.status} returned."
+        )
+    return response.data.decode("UTF-8")
+
+
+# The library's get and post (used by search and reviews) look this up on
+# every call.
+play_request._urlopen = _keep_alive_urlopen
 
 
 def search_app(
@@ -25,14 +73,127 @@ def search_app(
         return None
 
 
-def get_app_reviews(
+SEARCH_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".finrate_ph_search_cache.json"
+)
+SEARCH_CACHE_SIZE = 256
+
+_search_cache: Dict[str, List[Dict[str, Any]]] = {}
+# Searches may run concurrently; the network call itself is made unlocked.
+_search_cache_lock = threading.Lock()
+
+
+def cached_search_app(
+    app_name: str, country: str = "ph", lang: str = "en"
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Searches for apps on Google Play Store, reusing earlier results.
+
+    Queries are normalized (stripped and lowercased) so repeated searches
+    for the same app skip the network round-trip. Failed searches are not
+    cached. Safe to call from several threads at once.
+
+    Args:
+        app_name (str): The name of the app to search for.
+        country (str): The country code (default: "ph").
+        lang (str): The language code (default: "en").
+
+    Returns:
+        list: A list of search results (title and appId only) or None if no
+            results or an error occurs.
+    """
+    key = f"{country}:{lang}:{app_name.strip().lower()}"
+    with _search_cache_lock:
+        cached = _search_cache.get(key)
+    if cached is not None:
+        return cached
+
+    results = search_app(app_name.strip(), country=country, lang=lang)
+    if not results:
+        return None
+    cached = [
+        {"title": result["title"], "appId": result["appId"]}
+        for result in results
+    ]
+    with _search_cache_lock:
+        if (
+            key not in _search_cache
+            and len(_search_cache) >= SEARCH_CACHE_SIZE
+        ):
+            _search_cache.pop(next(iter(_search_cache)))
+        _search_cache[key] = cached
+    return cached
+
+
+def load_search_cache(filename: str = SEARCH_CACHE_FILE) -> None:
+    """
+    Loads previously saved search results into the search cache.
+
+    Args:
+        filename (str): The path to the JSON cache file.
+    """
+    if not os.path.exists(filename):
+        return
+    try:
+        with open(filename, encoding="utf-8") as cache_file:
+            _search_cache.update(json.load(cache_file))
+    except Exception as e:
+        print(f"Error loading search cache: {e}")
+
+
+def save_search_cache(filename: str = SEARCH_CACHE_FILE) -> None:
+    """
+    Saves the search cache so it survives restarts.
+
+    Args:
+        filename (str): The path to the JSON cache file.
+    """
+    try:
+        with open(filename, "w", encoding="utf-8") as cache_file:
+            json.dump(_search_cache, cache_file)
+    except Exception as e:
+        print(f"Error saving search cache: {e}")
+
+
+# The app ID is the same for every review, so it is left to the caller
+# instead of being repeated in a column.
+REVIEW_COLUMNS = ("review_text", "review_date", "review_rating")
+# Seconds to wait between review pages. The delay starts short and doubles
+# after each failed request, up to the maximum, in case Google Play is
+# rate limiting; it stays raised for the rest of the app's pages. Each
+# page is retried up to 3 times.
+PAGE_DELAY = 0.1
+MAX_PAGE_DELAY = 5.0
+
+
+def _fetch_review_page(
+    app_id: str,
+    country: str,
+    lang: str,
+    continuation_token: Any,
+    delay: float,
+) -> Tuple[List[Dict[str, Any]], Any]:
+    """Waits delay seconds, then fetches the page after continuation_token."""
+    if delay:
+        time.sleep(delay)
+    return reviews(
+        app_id,
+        lang=lang,
+        country=country,
+        sort=Sort.MOST_RELEVANT,
+        count=200,
+        continuation_token=continuation_token,
+    )
+
+
+def iter_review_pages(
     app_id: str,
     country: str = "ph",
     lang: str = "en",
     max_reviews: Optional[int] = None,
-) -> List[Dict[str, Union[str, int, Any]]]:
+) -> Iterator[Dict[str, List[Any]]]:
     """
-    Fetches reviews for a given app ID.
+    Fetches reviews for a given app ID one page at a time.
 
     Args:
         app_id (str): The ID of the app.
@@ -40,51 +201,102 @@ def get_app_reviews(
         lang (str): The language code (default: "en").
         max_reviews (int): Maximum number of reviews to fetch (default: None, fetches all).
 
-    Returns:
-        list: A list of reviews or an empty list if an error occurs.
+    Yields:
+        dict: One page of reviews as a mapping of column name (see
+            REVIEW_COLUMNS) to a list of values.
+
+    Raises:
+        Exception: The last error, if every retry for a page fails. The
+            pages fetched before it have already been yielded.
     """
-    all_reviews = []
     continuation_token = None
     review_count = 0
     retries = 3
+    attempt = 0
+    delay = PAGE_DELAY
+    wait_time = 0
 
-    for attempt in range(retries):
-        try:
-            while True:
-                result, continuation_token = reviews(
+    # Pages are chained by continuation token, so at most one request can
+    # be in flight. Start it as soon as the token is known, letting the
+    # network round-trip overlap with the caller's work on the last page.
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        while True:
+            try:
+                # Resumes from the last page that succeeded.
+                pending = prefetcher.submit(
+                    _fetch_review_page,
                     app_id,
-                    lang=lang,
-                    country=country,
-                    sort=Sort.MOST_RELEVANT,
-                    count=200,
-                    continuation_token=continuation_token,
+                    country,
+                    lang,
+                    continuation_token,
+                    wait_time,
                 )
+                while True:
+                    result, continuation_token = pending.result()
+                    attempt = 0  # Each page gets its own retries
+
+                    if max_reviews is not None:
+                        result = result[: max_reviews - review_count]
+                    review_count += len(result)
+                    done = continuation_token.token is None or (
+                        max_reviews is not None and review_count >= max_reviews
+                    )
+                    if not done:
+                        pending = prefetcher.submit(
+                            _fetch_review_page,
+                            app_id,
+                            country,
+                            lang,
+                            continuation_token,
+                            delay,
+                        )
+
+                    if result:
+                        yield {
+                            "review_text": [r["content"] for r in result],
+                            "review_date": [r["at"] for r in result],
+                            "review_rating": [r["score"] for r in result],
+                        }
+                    if done:
+                        return
 
-                for review_data in result:
-                    review = {
-                        "app_id": app_id,
-                        "review_text": review_data["content"],
-                        "review_date": review_data["at"],
-                        "review_rating": review_data["score"],
-                    }
-                    all_reviews.append(review)
-                    review_count += 1
-
-                    if max_reviews is not None and review_count >= max_reviews:
-                        return all_reviews
-
-                if continuation_token.token is None:
-                    break
-
-                time.sleep(1)
-
-            return all_reviews
-
-        except Exception as e:
-            print(f"Attempt {attempt + 1} failed: {e}")
-            if attempt == retries - 1:
-                print(f"Error fetching reviews for {app_id}: {e}")
-                return []
-            wait_time = min(2**attempt, 16)
-            print(f"Retrying in {wait_time} seconds...")
-            time.sleep(wait_time)
+            except Exception as e:
+                attempt += 1
+                print(f"Attempt {attempt} failed: {e}")
+                delay = min(delay * 2, MAX_PAGE_DELAY)
+                if attempt == retries:
+                    print(f"Error fetching reviews for {app_id}: {e}")
+                    raise
+                # The retry waits at least as long as the raised page delay.
+                wait_time = max(delay, min(2 ** (attempt - 1), 16))
+                print(f"Retrying in {wait_time} seconds...")
+
+
+def get_app_reviews(
+    app_id: str,
+    country: str = "ph",
+    lang: str = "en",
+    max_reviews: Optional[int] = None,
+) -> Dict[str, List[Any]]:
+    """
+    Fetches all reviews for a given app ID.
+
+    Args:
+        app_id (str): The ID of the app.
+        country (str): The country code (default: "ph").
+        lang (str): The language code (default: "en").
+        max_reviews (int): Maximum number of reviews to fetch (default: None, fetches all).
+
+    Returns:
+        dict: The reviews as a mapping of column name (see REVIEW_COLUMNS)
+            to a list of values. If fetching fails partway, the reviews
+            fetched so far.
+    """
+    columns: Dict[str, List[Any]] = {column: [] for column in REVIEW_COLUMNS}
+    try:
+        for page in iter_review_pages(app_id, country, lang, max_reviews):
+            for column, values in page.items():
+                columns[column].extend(values)
+    except Exception:
+        pass  # Already reported by iter_review_pages
+    return columns
@@ -1,20 +1,276 @@
+import os
+import time
+from typing import Any, Dict, List, Optional, TextIO, Tuple, Union
+
+import numpy as np
 import pandas as pd
 
+CSV_BUFFER_SIZE = 1 << 20
+# Rows formatted and written per batch, which bounds the memory used for
+# formatted text when saving large review sets.
+CSV_CHUNK_ROWS = 20_000
+# Cached reviews older than this (in seconds) are fetched again.
+REVIEW_CACHE_MAX_AGE = 24 * 60 * 60
+# Fixed dtypes for numeric review columns, so building a DataFrame does not
+# have to infer them value by value. Ratings are 1-5, so int8 suffices.
+REVIEW_DTYPES = {"review_rating": np.int8}
+
+
+def _csv_column(values: pd.Series) -> List[str]:
+    """Formats one column as CSV fields, quoting only where needed."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Format each category once; code -1 (missing) picks the "".
+        categories = _csv_column(pd.Series(values.cat.categories))
+        fields = np.array(categories + [""], dtype=object)
+        return fields[values.cat.codes.to_numpy()].tolist()
+    if pd.api.types.is_datetime64_any_dtype(values):
+        stamps = np.datetime_as_string(
+            values.to_numpy("datetime64[s]"), unit="s"
+        )
+        stamps = np.char.replace(stamps, "T", " ")
+        stamps[values.isna().to_numpy()] = ""
+        return stamps.tolist()
+    if pd.api.types.is_integer_dtype(values):
+        return values.astype(str).tolist()
+    text = values.astype(object).fillna("").astype(str)
+    needs_quotes = text.str.contains(r'[",\r\n]', regex=True)
+    if not needs_quotes.any():
+        return text.tolist()
+    quoted = '"' + text.str.replace('"', '""', regex=False) + '"'
+    return quoted.where(needs_quotes, text).tolist()
+
+
+def _write_csv(
+    reviews_df: pd.DataFrame, csv_file: TextIO, header: bool
+) -> None:
+    """
+    Writes reviews to an open file, CSV_CHUNK_ROWS rows at a time.
+
+    Review frames have a small fixed schema, so each column is formatted
+    in one vectorized pass and the rows are joined directly, skipping the
+    per-cell work of DataFrame.to_csv.
+    """
+    if header:
+        csv_file.write(",".join(reviews_df.columns) + "\n")
+    for start in range(0, len(reviews_df), CSV_CHUNK_ROWS):
+        chunk = reviews_df.iloc[start : start + CSV_CHUNK_ROWS]
+        columns = [_csv_column(chunk[name]) for name in chunk.columns]
+        rows = map(",".join, zip(*columns))
+        csv_file.write("\n".join(rows) + "\n")
+
 
-def save_reviews_to_csv(reviews_df: pd.DataFrame, filename: str) -> None:
+def save_reviews_to_csv(
+    reviews_df: pd.DataFrame,
+    filename: Union[str, TextIO],
+    header: bool = True,
+) -> None:
     """
     Saves a DataFrame of reviews to a CSV file.
 
     Args:
         reviews_df (pd.DataFrame): The DataFrame containing reviews.
-        filename (str): The path to the CSV file.
+        filename (str or file): The path to the CSV file, or an open file
+            to append the reviews to.
+        header (bool): Whether to write the column names (default: True).
     """
     if reviews_df.empty:
         print("No reviews to save.")
         return
 
     try:
-        reviews_df.to_csv(filename, index=False, encoding="utf-8")
-        print(f"Reviews saved to {filename}")
+        if isinstance(filename, str):
+            with open(
+                filename,
+                "w",
+                buffering=CSV_BUFFER_SIZE,
+                newline="",
+                encoding="utf-8",
+            ) as csv_file:
+                _write_csv(reviews_df, csv_file, header)
+            print(f"Reviews saved to {filename}")
+        else:
+            _write_csv(reviews_df, filename, header)
     except Exception as e:
         print(f"Error saving reviews to CSV: {e}")
+
+
+def build_reviews_dataframe(
+    review_columns: Dict[str, List[Any]], app_id: str, app_name: str
+) -> pd.DataFrame:
+    """
+    Builds a reviews DataFrame from column-oriented scraper output.
+
+    Args:
+        review_columns (dict): Mapping of column name to list of values,
+            as returned by get_app_reviews.
+        app_id (str): The ID of the app, added as the first column.
+        app_name (str): The display name of the app.
+
+    Returns:
+        pd.DataFrame: The reviews, with int8 ratings, second-resolution
+            review dates and categorical app_id and app_name columns.
+    """
+    reviews_df = pd.DataFrame(
+        {
+            column: (
+                np.asarray(values, dtype=REVIEW_DTYPES[column])
+                if column in REVIEW_DTYPES
+                else values
+            )
+            for column, values in review_columns.items()
+        }
+    )
+    # The scraper's datetime objects already arrive as datetime64, so only
+    # parse when the dates are strings (e.g. read back from CSV). Those are
+    # ISO 8601; naming the format skips pandas' per-value inference.
+    if not pd.api.types.is_datetime64_any_dtype(reviews_df["review_date"]):
+        reviews_df["review_date"] = pd.to_datetime(
+            reviews_df["review_date"],
+            format="ISO8601",
+            cache=True,
+            errors="coerce",
+        )
+    # Play Store timestamps have whole-second resolution.
+    reviews_df["review_date"] = reviews_df["review_date"].astype(
+        "datetime64[s]"
+    )
+    # The ID and name are the same for every review, so categoricals store
+    # them once plus a small code per row.
+    codes = np.zeros(len(reviews_df), dtype=np.int8)
+    reviews_df.insert(
+        0,
+        "app_id",
+        pd.Categorical.from_codes(codes, categories=[app_id]),
+    )
+    reviews_df["app_name"] = pd.Categorical.from_codes(
+        codes, categories=[app_name]
+    )
+    return reviews_df
+
+
+def _downcast_reviews(reviews_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts reviews to the compact dtypes build_reviews_dataframe
+    produces, for frames saved before those dtypes were used. Columns
+    that already match are left as they are.
+    """
+    for column, dtype in REVIEW_DTYPES.items():
+        if reviews_df[column].dtype != dtype:
+            reviews_df[column] = reviews_df[column].astype(dtype)
+    if reviews_df["review_date"].dtype != "datetime64[s]":
+        reviews_df["review_date"] = reviews_df["review_date"].astype(
+            "datetime64[s]"
+        )
+    for column in ("app_id", "app_name"):
+        if not isinstance(reviews_df[column].dtype, pd.CategoricalDtype):
+            reviews_df[column] = reviews_df[column].astype("category")
+    return reviews_df
+
+
+def review_cache_path(
+    output_dir: str, app_id: str, max_reviews: Optional[int]
+) -> str:
+    """
+    Returns the path of the cached reviews for an app and fetch limit.
+
+    Args:
+        output_dir (str): The directory the reviews are saved in.
+        app_id (str): The ID of the app.
+        max_reviews (int): The max_reviews the reviews were fetched with.
+
+    Returns:
+        str: The path to the Feather cache file.
+    """
+    limit = "all" if max_reviews is None else max_reviews
+    return os.path.join(output_dir, f"{app_id}_reviews_{limit}.feather")
+
+
+def _cache_entries(output_dir: str) -> List[Tuple[str, os.DirEntry]]:
+    """Lists the review cache files in a directory with their app IDs."""
+    try:
+        entries = list(os.scandir(output_dir))
+    except FileNotFoundError:
+        return []
+    return [
+        (entry.name.rsplit("_reviews_", 1)[0], entry)
+        for entry in entries
+        if entry.name.endswith(".feather") and "_reviews_" in entry.name
+    ]
+
+
+def find_cached_reviews(output_dir: str) -> Dict[str, str]:
+    """
+    Finds the newest review cache file for each app in a directory.
+
+    Args:
+        output_dir (str): The directory the reviews are saved in.
+
+    Returns:
+        dict: The path to the newest cache file by app ID (empty if the
+            directory does not exist).
+    """
+    cache_files = {}
+    newest = {}
+    for app_id, entry in _cache_entries(output_dir):
+        mtime = entry.stat().st_mtime
+        if mtime > newest.get(app_id, -1):
+            newest[app_id] = mtime
+            cache_files[app_id] = entry.path
+    return cache_files
+
+
+def remove_cached_reviews(output_dir: str, app_id: str) -> None:
+    """
+    Deletes every cache file of an app, whatever max_reviews it was
+    fetched with.
+
+    Args:
+        output_dir (str): The directory the reviews are saved in.
+        app_id (str): The ID of the app.
+    """
+    for cached_app_id, entry in _cache_entries(output_dir):
+        if cached_app_id != app_id:
+            continue
+        try:
+            os.remove(entry.path)
+        except Exception as e:
+            print(f"Error removing review cache: {e}")
+
+
+def save_cached_reviews(reviews_df: pd.DataFrame, filename: str) -> None:
+    """
+    Saves reviews to a Feather cache file.
+
+    Args:
+        reviews_df (pd.DataFrame): The DataFrame containing reviews.
+        filename (str): The path to the cache file.
+    """
+    try:
+        reviews_df.to_feather(filename)
+    except Exception as e:
+        print(f"Error saving review cache: {e}")
+
+
+def load_cached_reviews(
+    filename: str, max_age: float = REVIEW_CACHE_MAX_AGE
+) -> Optional[pd.DataFrame]:
+    """
+    Loads reviews from a Feather cache file if it is fresh enough.
+
+    Args:
+        filename (str): The path to the cache file.
+        max_age (float): The maximum age of the cache in seconds.
+
+    Returns:
+        pd.DataFrame: The cached reviews, or None if the cache is missing,
+            stale, or unreadable.
+    """
+    try:
+        if time.time() - os.path.getmtime(filename) > max_age:
+            return None
+        return _downcast_reviews(pd.read_feather(filename))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Error loading review cache: {e}")
+        return None